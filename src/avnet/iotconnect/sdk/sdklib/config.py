@@ -2,28 +2,30 @@
 # Copyright (C) 2024 Avnet
 # Authors: Nikola Markovic <nikola.markovic@avnet.com> et al.
 
+from dataclasses import dataclass
 from typing import Optional
 from .error import DeviceConfigError
 
 
+# eq=False keeps identity based equality and hashing, so the objects can still be used as dict keys
+@dataclass(eq=False)
 class DeviceProperties:
     """
     This class represents the /IOTCONNECT device properties
     like device Unique ID (DUID) and account properties lke CPID, Environment etc.
+
+    :param duid: Your Device Unique ID
+    :param cpid: Your account CPID (Company ID). You can locate this in you IoTConnect web UI at Settings -> Key Value
+    :param env: Your account environment. You can locate this in you IoTConnect web UI at Settings -> Key Value
+    :param platform: The IoTconnect IoT platform - Either "aws" for AWS IoTCore or "az" for Azure IoTHub
     """
 
-    def __init__(self, duid: str, cpid: str, env: str, platform: str):
-        """
-        :param platform: The IoTconnect IoT platform - Either "aws" for AWS IoTCore or "az" for Azure IoTHub
-        :param env: Your account environment. You can locate this in you IoTConnect web UI at Settings -> Key Value
-        :param cpid: Your account CPID (Company ID). You can locate this in you IoTConnect web UI at Settings -> Key Value
-        :param duid: Your Device Unique ID
-        """
+    __slots__ = ('duid', 'cpid', 'env', 'platform')
 
-        self.duid = duid
-        self.cpid = cpid
-        self.env = env
-        self.platform = platform
+    duid: str
+    cpid: str
+    env: str
+    platform: str
 
     def validate(self):
         """ Format validation in cases where custom topic configuration may be needed """
@@ -44,6 +46,8 @@ class DeviceTlsCredentials:
     Developer Note: The client will usually validate these files. There is little benefit in doing it on the lib side (for now).
     """
 
+    __slots__ = ('device_cert_path', 'device_pkey_path', 'server_ca_cert_path')
+
     def __init__(self, device_cert_path: str, device_pkey_path: str, server_ca_cert_path: Optional[str] = None):
         """
         :param device_cert_path: Path to the device certificate file
@@ -2,13 +2,20 @@
 # Copyright (C) 2024 Avnet
 # Authors: Nikola Markovic <nikola.markovic@avnet.com> and Zackary Andraka <zackary.andraka@avnet.com> et al.
 
+import base64
 import datetime
+import functools
+import http.client
 import json
+import logging
+import socket
 import ssl
+import time
 import urllib.parse
 import urllib.request
 from dataclasses import field, dataclass
-from typing import Final, Union, Optional
+from types import MappingProxyType
+from typing import Final, Mapping, Union, Optional
 from urllib.error import HTTPError, URLError
 
 from avnet.iotconnect.sdk.sdklib.config import DeviceProperties, DeviceTlsCredentials
@@ -16,10 +23,110 @@ from avnet.iotconnect.sdk.sdklib.error import DeviceConfigError, ClientError
 from avnet.iotconnect.sdk.sdklib.protocol.credentials import CredentialsResponseJson
 from avnet.iotconnect.sdk.sdklib.protocol.discovery import IotcDiscoveryResponseJson
 from avnet.iotconnect.sdk.sdklib.protocol.identity import ProtocolIdentityPJson, ProtocolMetaJson, ProtocolIdentityResponseJson
-from avnet.iotconnect.sdk.sdklib.util import deserialize_dataclass
+from avnet.iotconnect.sdk.sdklib.util import deserialize_dataclass, json_loads, DATACLASS_SLOTS
+
+log = logging.getLogger(__name__)
+
+# Send the same User-Agent that urllib.request.urlopen would send
+_USER_AGENT: Final[str] = "Python-urllib/%s" % urllib.request.__version__
+
+
+# Kept-alive connections that were idle for longer than this are not reused, as the server has likely closed them.
+_CONNECTION_IDLE_TIMEOUT_SECONDS: Final[float] = 30.0
+
+# Same redirect handling as urllib.request.HTTPRedirectHandler
+_REDIRECT_STATUSES: Final[frozenset[int]] = frozenset((301, 302, 303, 307, 308))
+_MAX_REDIRECTS: Final[int] = 10
+
+# Cached AWS credentials will be re-requested when they are about to expire within this time.
+_CREDENTIALS_REFRESH_MARGIN: Final[datetime.timedelta] = datetime.timedelta(minutes=5)
+
+# How long to reuse the base URL returned by discovery.
+_DISCOVERY_CACHE_TTL_SECONDS: Final[float] = 3600.0
+
+# (cpid, env, platform) -> (discovery base URL, expiry time per time.monotonic())
+_discovery_cache: dict[tuple[str, str, str], tuple[str, float]] = {}
+
+# How long to reuse resolved host addresses. This is well below the lifetime of the AWS credentials.
+_DNS_CACHE_TTL_SECONDS: Final[float] = 300.0
+
+# (host, port) -> (getaddrinfo() result, expiry time per time.monotonic())
+_dns_cache: dict[tuple[str, int], tuple[list, float]] = {}
+
+
+def _getaddrinfo_cached(host: str, port: int) -> list:
+    now = time.monotonic()
+    entry = _dns_cache.get((host, port))
+    if entry is not None and entry[1] > now:
+        return entry[0]
+    addresses = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    _dns_cache[(host, port)] = (addresses, now + _DNS_CACHE_TTL_SECONDS)
+    return addresses
+
+
+def _create_connection_cached(address: tuple[str, int], *args, **kwargs) -> socket.socket:
+    """ Same as socket.create_connection(), but resolves the host name through the DNS cache """
+    host, port = address
+    error = None
+    for *_, sockaddr in _getaddrinfo_cached(host, port):
+        try:
+            return socket.create_connection((sockaddr[0], port), *args, **kwargs)
+        except OSError as e:
+            error = e
+    # The cached addresses may be stale. Resolve the host again on next attempt.
+    _dns_cache.pop((host, port), None)
+    raise error if error is not None else OSError("Unable to resolve %s" % host)
+
+
+def _split_https_url(url: str) -> tuple[str, str]:
+    """
+    Splits an https URL into host (with optional port) and path (with query).
+    The URLs that we deal with are simple, so avoid the full urllib.parse.urlsplit() on every request.
+    """
+    if not url.startswith('https://'):
+        raise URLError("Unsupported URL: %s" % url)
+    url = url.partition('#')[0]
+    host_end = len(url)
+    for separator in '/?':
+        index = url.find(separator, 8)
+        if index != -1 and index < host_end:
+            host_end = index
+    host = url[8:host_end]
+    if not host:
+        raise URLError("URL is missing the host name: %s" % url)
+    path = url[host_end:]
+    if not path.startswith('/'):
+        path = '/' + path
+    return host, path
+
+
+class _HTTPSConnection(http.client.HTTPSConnection):
+    """
+    HTTPSConnection that resolves host names through the DNS cache.
+    TLS SNI, certificate validation and the Host header still use the host name.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._create_connection = _create_connection_cached
+
+
+def _get_https_proxy(host: str) -> Optional[urllib.parse.SplitResult]:
+    """ Returns the HTTPS proxy configured in the environment, the same one that urllib.request.urlopen would use """
+    proxy = urllib.request.getproxies().get('https')
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if '://' not in proxy:
+        proxy = 'http://' + proxy
+    return urllib.parse.urlsplit(proxy)
 
 
 class DeviceIdentityData:
+    __slots__ = (
+        'host', 'client_id', 'username', 'topics',
+        'pf', 'is_edge_device', 'is_gateway_device', 'protocol_version',
+        'vs', 'filesystem'
+    )
+
     def __init__(self, protocol_data: ProtocolIdentityPJson, metadata: ProtocolMetaJson):
         self.host = protocol_data.h
         self.client_id = protocol_data.id
@@ -34,7 +141,26 @@ class DeviceIdentityData:
         self.vs = protocol_data.vs
         self.filesystem = protocol_data.fs
 
-@dataclass
+@functools.lru_cache(maxsize=32)
+def _parse_expiration(s: str) -> datetime.datetime:
+    try:
+        # Fast path for the "2026-01-20T22:54:09Z" format that the credentials endpoints actually return
+        if len(s) == 20 and s[19] == 'Z' and s[10] == 'T' and s[4] == s[7] == '-' and s[13] == s[16] == ':':
+            digits = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+            # int() would also accept whitespace, signs and non-ASCII digits, which fromisoformat() rejects
+            if digits.isascii() and digits.isdigit():
+                return datetime.datetime(
+                    int(digits[0:4]), int(digits[4:6]), int(digits[6:8]),
+                    int(digits[8:10]), int(digits[10:12]), int(digits[12:14]),
+                    tzinfo=datetime.timezone.utc
+                )
+        # python 3.12 will be happy with the original format but 3.9 needs the Z replaced with +00:00
+        return datetime.datetime.fromisoformat(s.replace('Z', '+00:00'))
+    except ValueError:
+        raise ClientError("Unable to parse expiration string: %s" % s)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class AwsCredentialsResponse:
         """
         NOTE: We could just return CredentialsResponseJson object, but this class makes it
@@ -49,15 +175,32 @@ class AwsCredentialsResponse:
 
         @property
         def expiration(self) -> Optional[datetime.datetime]:
+            # The parsed values are cached, as the cached credentials are checked on every get_aws_credentials call
             if self.expiration_str is not None:
-                try:
-                    # python 3.12 will be happy with the original format but 3.9 needs the Z replaced with +00:00
-                    return datetime.datetime.fromisoformat(self.expiration_str.replace('Z', '+00:00'))
-                except ValueError:
-                    raise ClientError("Unable to parse expiration string: %s" % self.expiration_str)
+                return _parse_expiration(self.expiration_str)
             else:
                 return None
 
+def _credentials_expire_soon(credentials: AwsCredentialsResponse) -> bool:
+    """ Returns True if the credentials should not be reused, because they expire within the refresh margin """
+    try:
+        expiration = credentials.expiration
+    except ClientError:
+        return True
+    if expiration is None:
+        return True
+    if expiration.tzinfo is None:
+        # The credentials endpoints return UTC times, so assume UTC if the time zone is missing
+        expiration = expiration.replace(tzinfo=datetime.timezone.utc)
+    return expiration - datetime.datetime.now(datetime.timezone.utc) <= _CREDENTIALS_REFRESH_MARGIN
+
+
+@functools.lru_cache(maxsize=32)
+def _quote_url_value(value: str) -> str:
+    """ URL-encodes a device or account property. The same few values are quoted on every request, so cache them. """
+    return urllib.parse.quote(value, safe='')
+
+
 class DraDiscoveryUrl:
     API_URL_FORMAT: Final[str] = "https://discovery.iotconnect.io/api/v2.1/dsdk/cpId/%s/env/%s?pf=%s"
 
@@ -66,9 +209,9 @@ class DraDiscoveryUrl:
 
     def get_api_url(self) -> str:
         return DraDiscoveryUrl.API_URL_FORMAT % (
-            urllib.parse.quote(self.config.cpid, safe=''),
-            urllib.parse.quote(self.config.env, safe=''),
-            urllib.parse.quote(self.config.platform, safe='')
+            _quote_url_value(self.config.cpid),
+            _quote_url_value(self.config.env),
+            _quote_url_value(self.config.platform)
         )
 
 
@@ -81,7 +224,7 @@ class DraIdentityUrl:
     def get_uid_api_url(self, config: DeviceProperties) -> str:
         return DraIdentityUrl.UID_API_URL_FORMAT % (
             self.base_url,
-            urllib.parse.quote(config.duid, safe='')
+            _quote_url_value(config.duid)
         )
 
     def _validate_identity_response(self, ird: ProtocolIdentityResponseJson):
@@ -89,57 +232,61 @@ class DraIdentityUrl:
         pass
 
 
+# Descriptions of the error codes in discovery and identity responses
+_EC_DESCRIPTIONS: Final[Mapping[int, str]] = MappingProxyType({
+    0: "OK – No Error",
+    1: "Device not found. Device is not whitelisted to platform.",
+    2: "Device is not active.",
+    3: "Un-Associated. Device has not any template associated with it.",
+    4: "Device is not acquired. Device is created but it is in release state.",
+    5: "Device is disabled. It's disabled from broker by Platform Admin",
+    6: "Company not found as SID is not valid",
+    7: "Subscription is expired.",
+    8: "Connection Not Allowed.",
+    9: "Invalid Bootstrap Certificate.",
+    10: "Invalid Operational Certificate."
+})
+
+
 class DraDeviceInfoParser:
-    EC_RESPONSE_MAPPING = [
-        "OK – No Error",
-        "Device not found. Device is not whitelisted to platform.",
-        "Device is not active.",
-        "Un-Associated. Device has not any template associated with it.",
-        "Device is not acquired. Device is created but it is in release state.",
-        "Device is disabled. It's disabled from broker by Platform Admin",
-        "Company not found as SID is not valid",
-        "Subscription is expired.",
-        "Connection Not Allowed.",
-        "Invalid Bootstrap Certificate.",
-        "Invalid Operational Certificate."
-    ]
+    # The same descriptions, indexed by error code. Kept as a sequence for compatibility.
+    EC_RESPONSE_MAPPING: Final[tuple[str, ...]] = tuple(_EC_DESCRIPTIONS[ec] for ec in range(len(_EC_DESCRIPTIONS)))
 
     @classmethod
     def _parsing_common(cls, what: str, rd: Union[IotcDiscoveryResponseJson, ProtocolIdentityResponseJson]):
         """ Helper to parse either discovery or identity response common error fields """
 
-        ec_message = 'not available'
-        has_error = False
-        if rd.d is not None:
-            if rd.d.ec != 0:
-                has_error = True
-                if rd.d.ec < len(cls.EC_RESPONSE_MAPPING):
-                    ec_message = 'ec=%d (%s)' % (rd.d.ec, cls.EC_RESPONSE_MAPPING[rd.d.ec])
-                else:
-                    ec_message = 'ec==%d' % rd.d.ec
-        else:
-            has_error = True
-
-        if rd.status != 200:
-            has_error = True
+        ec = rd.d.ec if rd.d is not None else None
+        if ec == 0 and rd.status == 200:
+            return
 
-        if has_error:
-            raise DeviceConfigError(
-                '%s failed. Error: "%s" status=%d message=%s' % (
-                    what,
-                    ec_message,
-                    rd.status if rd.status is not None else -1,
-                    rd.message or "(message not available)"
-                )
+        ec_message = 'not available'
+        if ec is not None and ec != 0:
+            ec_description = _EC_DESCRIPTIONS.get(ec)
+            if ec_description is not None:
+                ec_message = 'ec=%d (%s)' % (ec, ec_description)
+            else:
+                ec_message = 'ec==%d' % ec
+
+        raise DeviceConfigError(
+            '%s failed. Error: "%s" status=%d message=%s' % (
+                what,
+                ec_message,
+                rd.status if rd.status is not None else -1,
+                rd.message or "(message not available)"
             )
+        )
 
     @classmethod
-    def parse_discovery_response(cls, discovery_response: str) -> str:
-        """ Parses discovery response JSON and Returns base URL or raises DeviceConfigError """
+    def parse_discovery_response(cls, discovery_response: Union[str, bytes]) -> str:
+        """
+        Parses discovery response JSON and Returns base URL or raises DeviceConfigError
+        The response can be passed as received, in bytes, without decoding it first.
+        """
 
         drd: IotcDiscoveryResponseJson
         try:
-            drd = deserialize_dataclass(IotcDiscoveryResponseJson, json.loads(discovery_response))
+            drd = deserialize_dataclass(IotcDiscoveryResponseJson, json_loads(discovery_response))
         except json.JSONDecodeError as json_error:
             raise DeviceConfigError("Discovery JSON Parsing Error: %s" % str(json_error))
         cls._parsing_common("Discovery", drd)
@@ -150,10 +297,10 @@ class DraDeviceInfoParser:
         return drd.d.bu
 
     @classmethod
-    def parse_identity_response(cls, identity_response: str) -> DeviceIdentityData:
+    def parse_identity_response(cls, identity_response: Union[str, bytes]) -> DeviceIdentityData:
         ird: ProtocolIdentityResponseJson
         try:
-            ird = deserialize_dataclass(ProtocolIdentityResponseJson, json.loads(identity_response))
+            ird = deserialize_dataclass(ProtocolIdentityResponseJson, json_loads(identity_response))
         except json.JSONDecodeError as json_error:
             raise DeviceConfigError("Identity JSON Parsing Error: %s" % str(json_error))
         cls._parsing_common("Identity", ird)
@@ -163,13 +310,13 @@ class DraDeviceInfoParser:
 class DraCredentialsParser:
 
     @classmethod
-    def parse_credentials_response(cls, response_str: str) -> CredentialsResponseJson:
+    def parse_credentials_response(cls, response_str: Union[str, bytes]) -> CredentialsResponseJson:
         """
         NOTE: raises DeviceConfigError or ClientError on error
         """
         crj: CredentialsResponseJson
         try:
-            crj = deserialize_dataclass(CredentialsResponseJson, json.loads(response_str))
+            crj = deserialize_dataclass(CredentialsResponseJson, json_loads(response_str))
         except json.JSONDecodeError as json_error:
             raise ClientError("Credentials JSON Parsing Error: %s" % str(json_error))
 
@@ -193,10 +340,12 @@ class DeviceRestApi:
     def __init__(self, config: DeviceProperties, tls_credentials: Optional[DeviceTlsCredentials] = None, verbose: Optional[bool] = False):
         """
         Device REST API class to perform DRA operations like getting identity data and AWS credentials.
+        HTTPS connections for credentials requests are kept alive for reuse. Call close() when done with this object,
+        or use it as a context manager ("with DeviceRestApi(...) as dra:"), so that they get closed.
         Greengrass SDK NOTE: The component will not usually NOT have access to cert/key files.
         :param config: DeviceProperties needed to perform DRA operations
         :param tls_credentials: Optional TLS credentials to use for some secured HTTPS requests
-        :param verbose: When true, this class will print verbose output to stdout
+        :param verbose: When true, this class will print verbose output to stdout. Otherwise, it is logged at debug level.
         """
         self.config = config
         self.tls_credentials = tls_credentials
@@ -205,17 +354,155 @@ class DeviceRestApi:
         # Cache this for use in get_aws_credentials and similar
         self.identity_response: Optional[DeviceIdentityData] = None
 
+        # Keep-alive HTTPS connections per host, along with the SSL context they were created with
+        # and the time when they were last used per time.monotonic(). Requests can then reuse the TCP and TLS sessions.
+        self._connections: dict[str, tuple[http.client.HTTPSConnection, Optional[ssl.SSLContext], float]] = {}
+
+        # AWS credentials per (credentials endpoint, client ID). They are reused until they are about to expire.
+        self._credentials_cache: dict[tuple[str, str], AwsCredentialsResponse] = {}
+
+        # SSL contexts for credentials requests per (device cert path, device key path, server CA cert path).
+        # Loading the certificates and the key is costly, and the connections can only be reused with the same context.
+        self._ssl_contexts: dict[tuple[str, str, Optional[str]], ssl.SSLContext] = {}
+
+    def invalidate_credentials(self, credentials_endpoint: Optional[str] = None):
+        """
+        Forces the next get_aws_credentials* call to request new credentials.
+        :param credentials_endpoint: Invalidate only the credentials for this endpoint.
+            If not specified, invalidate all and also reload the device certificate and key files on next request.
+        """
+        if credentials_endpoint is None:
+            self._credentials_cache.clear()
+            self._ssl_contexts.clear()
+        else:
+            for key in [k for k in self._credentials_cache if k[0] == credentials_endpoint]:
+                del self._credentials_cache[key]
+
+    def _log_verbose(self, msg: str, *args):
+        """ Prints the message if verbose, otherwise logs it at debug level. Formatting is skipped if not needed. """
+        if self.verbose:
+            print(msg % args)
+        else:
+            log.debug(msg, *args)
+
+    def close(self):
+        """ Closes any HTTPS connections that are kept alive by this object """
+        for conn, _, _ in self._connections.values():
+            conn.close()
+        self._connections.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _close_connections_without_client_cert(self):
+        """ Closes the connections used for discovery and identity requests, which are not made again once cached """
+        for host in [h for h, (_, context, _) in self._connections.items() if context is None]:
+            self._connections.pop(host)[0].close()
+
+    def _get_https_connection(self, host: str, context: Optional[ssl.SSLContext]) -> http.client.HTTPSConnection:
+        now = time.monotonic()
+        entry = self._connections.get(host)
+        if entry is not None:
+            conn, conn_context, last_used = entry
+            if conn_context is context and now - last_used <= _CONNECTION_IDLE_TIMEOUT_SECONDS:
+                self._connections[host] = (conn, context, now)
+                return conn
+            conn.close()
+        proxy = _get_https_proxy(host)
+        if proxy is None:
+            conn = _HTTPSConnection(host, context=context)
+        else:
+            conn = _HTTPSConnection(proxy.hostname, proxy.port or 80, context=context)
+            tunnel_headers = {}
+            if proxy.username is not None:
+                user_pass = '%s:%s' % (urllib.parse.unquote(proxy.username), urllib.parse.unquote(proxy.password or ''))
+                tunnel_headers['Proxy-Authorization'] = 'Basic ' + base64.b64encode(user_pass.encode()).decode('ascii')
+            conn.set_tunnel(host, headers=tunnel_headers)
+        self._connections[host] = (conn, context, now)
+        return conn
+
+    def _https_get(self, url: str, headers: Optional[dict[str, str]] = None, context: Optional[ssl.SSLContext] = None) -> bytes:
+        """
+        Performs an HTTPS GET request on a kept-alive connection and returns the response body.
+        Redirects are followed, and HTTPError or URLError are raised on failure, same as urllib.request.urlopen would do.
+        """
+        request_headers = {"User-Agent": _USER_AGENT}
+        if headers is not None:
+            request_headers.update(headers)
+
+        for _ in range(_MAX_REDIRECTS + 1):
+            response, data = self._https_get_once(url, request_headers, context)
+            location = response.getheader('Location')
+            if response.status in _REDIRECT_STATUSES and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if response.status >= 300:
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            return data
+
+        raise HTTPError(url, response.status, "Too many redirects: %s" % response.reason, response.headers, None)
+
+    def _https_get_once(self, url: str, request_headers: dict[str, str], context: Optional[ssl.SSLContext]) -> tuple[http.client.HTTPResponse, bytes]:
+        host, path = _split_https_url(url)
+        conn = self._get_https_connection(host, context)
+        try:
+            try:
+                conn.request("GET", path, headers=request_headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The server may have closed the idle keep-alive connection. Retry once with a new connection.
+                conn.close()
+                conn.request("GET", path, headers=request_headers)
+                response = conn.getresponse()
+            # Always read the body, so that the connection can be reused for the next request
+            return response, response.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise URLError(e)
+
+    @staticmethod
+    def invalidate_discovery_cache():
+        """ Forces the next get_identity_data() call to request discovery data again, for all DeviceRestApi objects """
+        _discovery_cache.clear()
+
+    def invalidate_identity(self):
+        """ Forces the next get_identity_data() call to request the identity data again """
+        self.identity_response = None
+
     def get_identity_data(self) -> DeviceIdentityData:
+        """
+        Requests discovery and then identity data for the device.
+        The identity data is cached by this object and returned by subsequent calls until invalidate_identity() is called.
+        The discovery base URL is cached per account (CPID, environment and platform) for an hour,
+        so other devices on the same account only need to request the identity data.
+        """
+        if self.identity_response is not None:
+            return self.identity_response
+
+        discovery_key = (self.config.cpid, self.config.env, self.config.platform)
         try:
-            if self.verbose:
-                print("Requesting Discovery Data %s..." % DraDiscoveryUrl(self.config).get_api_url())
-            resp = urllib.request.urlopen(urllib.request.Request(DraDiscoveryUrl(self.config).get_api_url()))
-            discovery_base_url = DraDeviceInfoParser.parse_discovery_response(resp.read())
-
-            if self.verbose:
-                print("Requesting Identity Data %s..." % DraIdentityUrl(discovery_base_url).get_uid_api_url(self.config))
-            resp = urllib.request.urlopen(DraIdentityUrl(discovery_base_url).get_uid_api_url(self.config))
-            self.identity_response = DraDeviceInfoParser.parse_identity_response(resp.read())
+            cached = _discovery_cache.get(discovery_key)
+            if cached is not None and cached[1] > time.monotonic():
+                discovery_base_url = cached[0]
+            else:
+                discovery_url = DraDiscoveryUrl(self.config).get_api_url()
+                self._log_verbose("Requesting Discovery Data %s...", discovery_url)
+                resp = self._https_get(discovery_url)
+                discovery_base_url = DraDeviceInfoParser.parse_discovery_response(resp)
+                _discovery_cache[discovery_key] = (discovery_base_url, time.monotonic() + _DISCOVERY_CACHE_TTL_SECONDS)
+
+            identity_url = DraIdentityUrl(discovery_base_url).get_uid_api_url(self.config)
+            self._log_verbose("Requesting Identity Data %s...", identity_url)
+            try:
+                resp = self._https_get(identity_url)
+            except (HTTPError, URLError):
+                # The cached base URL may no longer be valid. Run discovery again on next attempt.
+                _discovery_cache.pop(discovery_key, None)
+                raise
+            self.identity_response = DraDeviceInfoParser.parse_identity_response(resp)
             return self.identity_response
 
         except HTTPError as http_error:
@@ -224,6 +511,21 @@ class DeviceRestApi:
         except URLError as url_error:
             raise DeviceConfigError(str(url_error))
 
+        finally:
+            # Discovery and identity are requested rarely, so do not keep idle connections open for them
+            self._close_connections_without_client_cert()
+
+    async def get_identity_data_async(self) -> DeviceIdentityData:
+        """
+        Same as get_identity_data(), but runs the requests in a worker thread.
+        Use this to get the identity data for multiple devices in parallel with asyncio.gather().
+        Do not call other methods on this object while the requests are in progress.
+        """
+        # Imported here so that synchronous users do not pay for loading asyncio.
+        # Any caller awaiting this already has it loaded, so the import is only a lookup.
+        import asyncio
+        return await asyncio.to_thread(self.get_identity_data)
+
     def get_aws_credentials_kvs(
         self,
         client_id: Optional[str] = None, # AKA thing_name
@@ -273,10 +575,14 @@ class DeviceRestApi:
     ) -> AwsCredentialsResponse:
         """
         Note: Call one of the appropriate get_aws_credentials_* instead, unless you need to do something custom.
+        The credentials are cached and the same credentials will be returned until they are about to expire.
+        Call invalidate_credentials() to force a new request.
         """
 
         if not credentials_endpoint:
             raise ValueError("Credential endpoint URL is required")
+        if not credentials_endpoint.startswith('https://'):
+            raise ValueError("Credential endpoint must be an https:// URL")
 
         if not client_id and self.identity_response:
             client_id = self.identity_response.client_id
@@ -297,33 +603,42 @@ class DeviceRestApi:
         if not device_cert_path or not device_pkey_path:
             raise DeviceConfigError("Device certificate and private key paths are required for AWS credentials request")
 
-        if self.verbose:
-            print(f"Requesting credentials from {credentials_endpoint}")
-
-        context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        context.check_hostname = True
-        context.verify_mode = ssl.CERT_REQUIRED
-
-        what = "device cert/private key credentials"
-        try:
-            context.load_cert_chain(certfile=device_cert_path, keyfile=device_pkey_path)
-            if server_ca_cert_path:
-                what="server CA certificate"
-                context.load_verify_locations(cafile=server_ca_cert_path)
-        except ssl.SSLError as e:
-            raise DeviceConfigError(f"Error processing {what}. Are the key and the cert matching? SSL details: {e} (errno: {e.errno}, reason: {e.reason}, strerror: {e.strerror}")
-        except HTTPError as e:
-            raise DeviceConfigError(f"HTTPError while processing {what}: {e}")
-        except RuntimeError as e:
-            raise DeviceConfigError(f"Error processing {what}. Error details: {e}")
-
-        req = urllib.request.Request(credentials_endpoint)
-        req.add_header("x-amzn-iot-thingname", client_id)
-
-        resp_str: str
+        cache_key = (credentials_endpoint, client_id)
+        cached = self._credentials_cache.get(cache_key)
+        if cached is not None and not _credentials_expire_soon(cached):
+            return cached
+
+        self._log_verbose("Requesting credentials from %s", credentials_endpoint)
+
+        ssl_context_key = (device_cert_path, device_pkey_path, server_ca_cert_path)
+        context = self._ssl_contexts.get(ssl_context_key)
+        if context is None:
+            context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+            context.check_hostname = True
+            context.verify_mode = ssl.CERT_REQUIRED
+
+            what = "device cert/private key credentials"
+            try:
+                context.load_cert_chain(certfile=device_cert_path, keyfile=device_pkey_path)
+                if server_ca_cert_path:
+                    what="server CA certificate"
+                    context.load_verify_locations(cafile=server_ca_cert_path)
+            except ssl.SSLError as e:
+                raise DeviceConfigError(f"Error processing {what}. Are the key and the cert matching? SSL details: {e} (errno: {e.errno}, reason: {e.reason}, strerror: {e.strerror}")
+            except HTTPError as e:
+                raise DeviceConfigError(f"HTTPError while processing {what}: {e}")
+            except RuntimeError as e:
+                raise DeviceConfigError(f"Error processing {what}. Error details: {e}")
+            self._ssl_contexts[ssl_context_key] = context
+
+        resp_data: bytes
         try:
-            with urllib.request.urlopen(req, context=context) as response:
-                resp_str = response.read()
+            try:
+                resp_data = self._https_get(credentials_endpoint, headers={"x-amzn-iot-thingname": client_id}, context=context)
+            except (ssl.SSLError, HTTPError, URLError):
+                # The device certificate may have been replaced. Load the certificate files again on next attempt.
+                self._ssl_contexts.pop(ssl_context_key, None)
+                raise
         except ssl.SSLError as e:
             raise DeviceConfigError(f"SSLError while connecting to credentials endpoint. SSL details: {e} (errno: {e.errno}, reason: {e.reason}, strerror: {e.strerror}")
         except HTTPError as e:
@@ -334,10 +649,12 @@ class DeviceRestApi:
             raise DeviceConfigError(f"Error while connecting to credentials endpoint. Error details: {e}")
 
         # will raise DeviceConfigError or ClientError on error
-        creds = DraCredentialsParser.parse_credentials_response(resp_str)
-        return AwsCredentialsResponse(
+        creds = DraCredentialsParser.parse_credentials_response(resp_data)
+        ret = AwsCredentialsResponse(
             access_key_id=creds.credentials.accessKeyId,
             secret_access_key=creds.credentials.secretAccessKey,
             session_token=creds.credentials.sessionToken,
             expiration_str=creds.credentials.expiration
         )
+        self._credentials_cache[cache_key] = ret
+        return ret
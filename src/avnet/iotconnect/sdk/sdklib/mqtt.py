@@ -2,7 +2,6 @@
 # Copyright (C) 2024 Avnet
 # Authors: Nikola Markovic <nikola.markovic@avnet.com> and Zackary Andraka <zackary.andraka@avnet.com> et al.
 
-import json
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from json import JSONDecodeError
@@ -10,8 +9,8 @@ from typing import Union, Optional
 
 from avnet.iotconnect.sdk.sdklib.error import C2DDecodeError
 from avnet.iotconnect.sdk.sdklib.protocol.c2d import ProtocolC2dMessageJson, ProtocolCommandMessageJson, ProtocolOtaUrlJson, ProtocolOtaMessageJson
-from avnet.iotconnect.sdk.sdklib.protocol.d2c import ProtocolTelemetryMessageJson, ProtocolTelemetryEntryJson, ProtocolAckMessageJson, ProtocolAckDJson
-from avnet.iotconnect.sdk.sdklib.util import dataclass_factory_filter_empty, to_iotconnect_time_str, deserialize_dataclass
+from avnet.iotconnect.sdk.sdklib.protocol.d2c import ProtocolAckMessageJson, ProtocolAckDJson
+from avnet.iotconnect.sdk.sdklib.util import dataclass_factory_filter_empty, to_iotconnect_time_str, deserialize_dataclass, json_dumps, json_loads, json_default_filter_empty, DATACLASS_SLOTS
 
 # This file contains definitions related to (inbound or outbound) C2D Messages
 
@@ -21,8 +20,10 @@ TelemetryValueType = Union[None, str, int, float, bool, tuple[float, float], Tel
 TelemetryValues = dict[str, TelemetryValueType]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TelemetryRecord:
+    # The values can also be a dataclass instance, with fields of TelemetryValueType or nested dataclasses.
+    # Dataclass fields that are None are not sent.
     values: TelemetryValues
     timestamp: datetime = None
     unique_id: str = None
@@ -194,8 +195,9 @@ def encode_telemetry_records(records: list[TelemetryRecord], recordset_timestamp
     See https://docs.iotconnect.io/iotconnect/sdk/message-protocol/device-message-2-1/d2c-messages/#Device for more information.
 
     :param TelemetryRecord records:
-        A set of ordered name-value telemetry pairs (TelemetryValueType)
-        with optional individual record timestamps to send. Each TelemetryValueType value can be
+        A set of ordered name-value telemetry pairs (TelemetryValueType), or dataclass instances,
+        with optional individual record timestamps to send. Dataclass fields that are None are not sent,
+        also when the dataclass is nested in other values. Each TelemetryValueType value can be
             - a primitive value: Maps directly to a JSON string, number or boolean
             - None: Maps to JSON null,
             - Tuple[float, float]: Used to send a lat/long geographic coordinate as decimal degrees as an
@@ -211,21 +213,27 @@ def encode_telemetry_records(records: list[TelemetryRecord], recordset_timestamp
         The server receipt timestamp will be applied to the telemetry values in this telemetry record.
         Supply this value using to_to_iotconnect_time_str() if you need more control over timestamps.
     """
-    packet = ProtocolTelemetryMessageJson()
-    for r in records:
-        packet_entry = ProtocolTelemetryEntryJson(
-            d=r.values,
-            dt=None if r.timestamp is None else to_iotconnect_time_str(r.timestamp),
-            id=r.unique_id,
-            tg=r.tag
-        )
-        packet.d.append(asdict(packet_entry, dict_factory=dataclass_factory_filter_empty))
+    # The telemetry values are not converted or copied here. The JSON encoder will handle dicts and dataclasses.
+    packet = {'d': [_telemetry_entry_dict(r) for r in records]}
     if recordset_timestamp is not None:
-        packet.dt = to_iotconnect_time_str(recordset_timestamp)
-    return json.dumps(asdict(packet, dict_factory=dataclass_factory_filter_empty), separators=(',', ':'))
+        packet['dt'] = to_iotconnect_time_str(recordset_timestamp)
+    return json_dumps(packet, default=json_default_filter_empty)
+
+
+def _telemetry_entry_dict(record: TelemetryRecord) -> dict:
+    # Builds the ProtocolTelemetryEntryJson structure as a dict directly, leaving out the empty fields.
+    # This avoids creating an intermediate dataclass object for each record.
+    entry = {'d': record.values}
+    if record.timestamp is not None:
+        entry['dt'] = to_iotconnect_time_str(record.timestamp)
+    if record.unique_id is not None:
+        entry['id'] = record.unique_id
+    if record.tag is not None:
+        entry['tg'] = record.tag
+    return entry
 
 
-def encode_single_telemetry_record(values: dict[str, TelemetryValueType], timestamp: datetime = None) -> str:
+def encode_single_telemetry_record(values: TelemetryValues, timestamp: datetime = None) -> str:
     """
     Creates a telemetry packet single telemetry dataset that should be sent to the back end
     If you need gateway/child functionality or need to send multiple data sets in one packet,
@@ -234,7 +242,8 @@ def encode_single_telemetry_record(values: dict[str, TelemetryValueType], timest
     See https://docs.iotconnect.io/iotconnect/sdk/message-protocol/device-message-2-1/d2c-messages/#Device for more information.
 
     :param TelemetryValues values:
-        The name-value telemetry pairs to send. Each value can be
+        The name-value telemetry pairs to send, or a dataclass instance with the values as its fields.
+        Dataclass fields that are None are not sent, also when the dataclass is nested in other values. Each value can be
             - a primitive value: Maps directly to a JSON string, number or boolean
             - None: Maps to JSON null,
             - Tuple[float, float]: Used to send a lat/long geographic coordinate as decimal degrees as an
@@ -252,10 +261,7 @@ def encode_single_telemetry_record(values: dict[str, TelemetryValueType], timest
 
     """
 
-    return encode_telemetry_records([TelemetryRecord(
-        values=values,
-        timestamp=timestamp
-    )])
+    return json_dumps({'d': [_telemetry_entry_dict(TelemetryRecord(values=values, timestamp=timestamp))]}, default=json_default_filter_empty)
 
 
 def encode_c2d_ack(ack_id: str, message_type: int, status: int, message_str: str = None) -> str:
@@ -280,7 +286,7 @@ def encode_c2d_ack(ack_id: str, message_type: int, status: int, message_str: str
             msg=message_str
         )
     )
-    return json.dumps(asdict(packet, dict_factory=dataclass_factory_filter_empty), separators=(',', ':'))
+    return json_dumps(asdict(packet, dict_factory=dataclass_factory_filter_empty))
 
 
 def decode_c2d_message(payload: str) -> C2DDecodeResult:
@@ -293,7 +299,7 @@ def decode_c2d_message(payload: str) -> C2DDecodeResult:
     try:
         # use the simplest form of ProtocolC2dMessageJson when deserializing first and
         # convert message to appropriate one later
-        raw_message = json.loads(payload)
+        raw_message = json_loads(payload)
         message_packet = deserialize_dataclass(ProtocolC2dMessageJson, raw_message)
         message = C2dMessage(message_packet)
 
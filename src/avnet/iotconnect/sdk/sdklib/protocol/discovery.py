@@ -5,8 +5,10 @@
 from dataclasses import dataclass, field
 from typing import Optional
 
+from avnet.iotconnect.sdk.sdklib.util import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProtocolDiscoveryDJson:
     ec: Optional[int] = field(default=None)
     bu: Optional[str] = field(default=None)
@@ -15,7 +17,7 @@ class ProtocolDiscoveryDJson:
     errorMsg: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class IotcDiscoveryResponseJson:
     d: ProtocolDiscoveryDJson = field(default_factory=ProtocolDiscoveryDJson)
     status: Optional[int] = field(default=None)
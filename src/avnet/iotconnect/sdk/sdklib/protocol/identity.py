@@ -5,8 +5,10 @@
 from dataclasses import dataclass, field
 from typing import Optional, List
 
+from avnet.iotconnect.sdk.sdklib.util import DATACLASS_SLOTS, intern_str_fields
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProtocolMetaJson:
     at: Optional[int] = None
     df: Optional[int] = None
@@ -19,7 +21,7 @@ class ProtocolMetaJson:
     v: float = field(default=0.0)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProtocolHasJson:
     d: int = field(default=0)
     attr: int = field(default=0)
@@ -28,15 +30,18 @@ class ProtocolHasJson:
     ota: int = field(default=0)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProtocolSetJson:
     pub: Optional[str] = None
     sub: Optional[str] = None
     pubForAll: Optional[str] = None
     subForAll: Optional[str] = None
 
+    def __post_init__(self):
+        intern_str_fields(self, ('pub', 'sub', 'pubForAll', 'subForAll'))
+
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProtocolTopicsJson:
     rpt: Optional[str] = None
     flt: Optional[str] = None
@@ -49,8 +54,12 @@ class ProtocolTopicsJson:
     c2d: Optional[str] = None
     set: ProtocolSetJson = field(default_factory=ProtocolSetJson)
 
+    def __post_init__(self):
+        # The topics are compared when routing MQTT messages. Interned strings compare by identity.
+        intern_str_fields(self, ('rpt', 'flt', 'od', 'hb', 'ack', 'dl', 'di', 'fu', 'c2d'))
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProtocolVideoStreamingJson:
     url: Optional[str] = None  # AWS IoT credentials endpoint
     as_: Optional[bool] = field(default=None)
@@ -58,18 +67,20 @@ class ProtocolVideoStreamingJson:
     @staticmethod
     def _preprocess_data(data: dict) -> dict:
         # We have to hack around the 'as' keyword since it's reserved in Python.
+        # Rename it in a copy, so that the caller's dict is left intact.
         if 'as' in data:
-            data = {**data, 'as_': data.pop('as')}
+            data = dict(data)
+            data['as_'] = data.pop('as')
         return data
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProtocolBucketsJson:
     bn: Optional[str] = None    # Bucket name
     ca: Optional[bool] = None   # ca="customer account" (cross-account?)
     rarn: Optional[str] = None  # role arn
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProtocolFsJson:
     """
     Note about credentials:
@@ -84,7 +95,7 @@ class ProtocolFsJson:
     url: Optional[str] = None  # AWS IoT credentials endpoint
     buckets: List[ProtocolBucketsJson] = field(default=None)
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProtocolIdentityPJson:
     n: Optional[str] = None
     h: Optional[str] = None
@@ -95,8 +106,11 @@ class ProtocolIdentityPJson:
     vs: Optional[ProtocolVideoStreamingJson] = None
     fs: Optional[ProtocolFsJson] = None
 
+    def __post_init__(self):
+        intern_str_fields(self, ('id', 'un'))
+
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProtocolIdentityDJson:
     ec: int = field(default=0)
     ct: int = field(default=0)
@@ -106,7 +120,7 @@ class ProtocolIdentityDJson:
     dt: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProtocolIdentityResponseJson:
     d: ProtocolIdentityDJson = field(default_factory=ProtocolIdentityDJson)
     status: int = field(default=0)
@@ -2,16 +2,76 @@
 # Copyright (C) 2024 Avnet
 # Authors: Nikola Markovic <nikola.markovic@avnet.com> and Zackary Andraka <zackary.andraka@avnet.com> et al.
 
-from dataclasses import fields, is_dataclass
+import functools
+import json
+import sys
+from dataclasses import asdict, fields, is_dataclass
 from datetime import datetime, timedelta
 from typing import get_type_hints, Type, Union, TypeVar
 
 
+def _json_default(obj):
+    # Serialize dataclasses the same way that orjson does
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError("Object of type %s is not JSON serializable" % type(obj).__name__)
+
+
+def _json_dumps_stdlib(obj, default=_json_default) -> str:
+    # Write non-ASCII characters as they are, like orjson does
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=default)
+
+
+# orjson is an optional dependency (pip install iotconnect-lib[fast]) that parses and encodes JSON considerably faster.
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError, so callers can catch the latter in either case.
+# json_dumps(obj, default=_json_default) encodes the object into compact JSON, with dataclasses encoded as objects.
+# Pass default=json_default_filter_empty to leave out None fields of dataclasses.
+# The json module behavior is the reference: Dataclasses are converted with the default function in both cases,
+# datetime values are rejected in both cases, and anything that orjson cannot encode (like integers above 64 bits
+# or named tuples) is encoded with the json module instead. Differences that remain with orjson:
+# - NaN and infinite floats are written as null, instead of NaN and Infinity, which are not valid JSON.
+# - Floats with exponents are written in a shorter form, like 1e20 instead of 1e+20. The values are the same.
+# - Some values that the json module rejects with TypeError are encoded, like Enum and UUID values.
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def _json_dumps_orjson(obj, default=_json_default) -> str:
+        try:
+            return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS).decode('utf-8')
+        except orjson.JSONEncodeError:
+            return _json_dumps_stdlib(obj, default)
+
+    json_loads = orjson.loads
+    json_dumps = _json_dumps_orjson
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+    json_dumps = _json_dumps_stdlib
+
+# Use as @dataclass(**DATACLASS_SLOTS). dataclass(slots=True) is only available in python 3.10+
+# and python 3.9 will get dataclasses without slots.
+DATACLASS_SLOTS: dict = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 def to_iotconnect_time_str(ts: datetime) -> str:
     ms_str = f"{ts.microsecond // 1000:03d}"
     return ts.strftime(f"%Y-%m-%dT%H:%M:%S.{ms_str}Z")
 
 
+def intern_str_fields(obj, field_names: tuple[str, ...]):
+    """
+    Replaces str values of the given object fields with interned strings.
+    Use this for values like MQTT topics that repeat across responses and are compared often.
+    Works with frozen dataclasses as well.
+    """
+    for name in field_names:
+        value = getattr(obj, name)
+        if type(value) is str:
+            object.__setattr__(obj, name, sys.intern(value))
+
+
 def dict_filter_empty(input_dict: dict):
     return {k: v for k, v in input_dict.items() if v is not None}
 
@@ -20,9 +80,41 @@ def dataclass_factory_filter_empty(data):
     return {key: value for key, value in data if value is not None}
 
 
+def json_default_filter_empty(obj):
+    """ json_dumps() default function that encodes dataclasses like asdict(obj, dict_factory=dataclass_factory_filter_empty) """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj, dict_factory=dataclass_factory_filter_empty)
+    raise TypeError("Object of type %s is not JSON serializable" % type(obj).__name__)
+
+
 T = TypeVar("T")
 
 
+@functools.lru_cache(maxsize=None)
+def _get_field_decoders(cls: type) -> dict:
+    """
+    Maps each field name of the dataclass to its type, if the value needs to be deserialized recursively,
+    or to None if the value can be used as is. Optional[SomeDataclass] is resolved to SomeDataclass up front.
+    This is computed once per class, as get_type_hints() evaluates all annotations of the class and its bases every time.
+    """
+    return {
+        name: _unwrap_optional(field_type)
+        if _is_optional_or_dataclass(field_type)
+           or (hasattr(field_type, '__origin__') and field_type.__origin__ == list)
+        else None
+        for name, field_type in get_type_hints(cls).items()
+    }
+
+
+def _unwrap_optional(field_type):
+    """ Returns T for Optional[T], or the field type itself otherwise """
+    if hasattr(field_type, '__origin__') and field_type.__origin__ is Union:
+        inner_types = field_type.__args__
+        if len(inner_types) == 2 and type(None) in inner_types:
+            return [t for t in inner_types if t is not type(None)][0]
+    return field_type
+
+
 def deserialize_dataclass(cls: Type[T], data: Union[dict, list]) -> T:
     """
     Recursively deserialize data into a dataclass or a list of dataclasses.
@@ -47,26 +139,18 @@ def deserialize_dataclass(cls: Type[T], data: Union[dict, list]) -> T:
             # Allow class to pre-process data (e.g., rename reserved keywords)
             if hasattr(cls, '_preprocess_data'):
                 data = cls._preprocess_data(data)
-        field_types = get_type_hints(cls)
+        field_decoders = _get_field_decoders(cls)
         return cls(
             **{
-                key: deserialize_dataclass(field_types[key], value)
-                if key in field_types and _is_optional_or_dataclass(field_types[key], value)
-                else (
-                    deserialize_dataclass(field_types[key], value)
-                    if key in field_types
-                       and hasattr(field_types[key], '__origin__')
-                       and field_types[key].__origin__ == list
-                    else value
-                )
+                key: value if field_decoders[key] is None else deserialize_dataclass(field_decoders[key], value)
                 for key, value in data.items()
-                if key in field_types  # Ignore unexpected fields
+                if key in field_decoders  # Ignore unexpected fields
             }
         )
     return data
 
 
-def _is_optional_or_dataclass(field_type, value):
+def _is_optional_or_dataclass(field_type):
     """
     Check if a field type is either an Optional or a dataclass.
     """
@@ -1,4 +1,4 @@
-import copy
+import dataclasses
 import os
 
 import pytest
@@ -30,7 +30,7 @@ def device_properties():
         tests_dir = Path(__file__).parent
         sys.path.insert(0, str(tests_dir))
         from accountcfg import DEVICE_PROPERTIES
-        return copy.deepcopy(DEVICE_PROPERTIES)
+        return DEVICE_PROPERTIES
     except ImportError:
         pytest.fail("Missing accountcfg.py with DEVICE_PROPERTIES")
 
@@ -39,18 +39,21 @@ def test_configure(device_properties):
     assert dra.get_identity_data() is not None
 
 def test_validation(device_properties):
-    # Each test gets fresh copy of properties
-    props = copy.deepcopy(device_properties)
-    props.cpid = "X"
+    # The shared properties are never mutated; each check validates a modified copy
+    props = dataclasses.replace(device_properties, cpid="X")
     with pytest.raises(DeviceConfigError):
         props.validate()
 
-    props = copy.deepcopy(device_properties)
-    props.env = "X"
+    props = dataclasses.replace(device_properties, env="X")
     with pytest.raises(DeviceConfigError):
         props.validate()
 
-    props = copy.deepcopy(device_properties)
-    props.platform = None
+    props = dataclasses.replace(device_properties, platform=None)
     with pytest.raises(DeviceConfigError):
         props.validate()
+
+def test_properties_hashable():
+    props = DeviceProperties(duid="myduid", cpid="ABCDEFG123456", env="poc", platform="aws")
+    copy = dataclasses.replace(props)
+    assert {props: 1, copy: 2}[props] == 1
+    assert props != copy
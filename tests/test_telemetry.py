@@ -1,9 +1,12 @@
+import collections
+import dataclasses
 import datetime
 import json
 import pytest
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 import avnet.iotconnect.sdk.sdklib.mqtt as lib_mqtt
+import avnet.iotconnect.sdk.sdklib.util as lib_util
 
 
 # a fictional nested dataclass that we can use to test encoding with
@@ -54,23 +57,58 @@ def test_timestamp_encoding():
 
 
 def test_dataclass_encoding(sensor_data):
-    packet = lib_mqtt.encode_single_telemetry_record(asdict(sensor_data))
+    packet = lib_mqtt.encode_single_telemetry_record(sensor_data)
     data = json.loads(packet)
     assert data["d"][0]["d"]["temperature"] == 22.8
     assert data["d"][0]["d"]["accel"]["x"] == 0.565
 
 
+def test_dataclass_none_fields(sensor_data):
+    # None fields of dataclasses are left out, but None values in dicts are sent as null
+    sensor_data = dataclasses.replace(sensor_data, humidity=None, accel=dataclasses.replace(sensor_data.accel, z=None))
+    packet = lib_mqtt.encode_single_telemetry_record(sensor_data)
+    assert json.loads(packet)["d"][0]["d"] == {"temperature": 22.8, "accel": {"x": 0.565, "y": 0.334}}
+
+    packet = lib_mqtt.encode_single_telemetry_record({'sensor': sensor_data, 'empty': None})
+    assert json.loads(packet)["d"][0]["d"] == {"sensor": {"temperature": 22.8, "accel": {"x": 0.565, "y": 0.334}}, "empty": None}
+
+
 def test_multiple_records(sensor_data):
     records = []
     timestamp = datetime.datetime.fromtimestamp(1744830740.478986, datetime.timezone.utc)
 
-    sensor_data.temperature = 44.44
-    records.append(lib_mqtt.TelemetryRecord(asdict(sensor_data), timestamp))
-
-    sensor_data.temperature = 33.33
-    records.append(lib_mqtt.TelemetryRecord(asdict(sensor_data), timestamp))
+    # The records keep references to the values, so use separate copies
+    records.append(lib_mqtt.TelemetryRecord(dataclasses.replace(sensor_data, temperature=44.44), timestamp))
+    records.append(lib_mqtt.TelemetryRecord(dataclasses.replace(sensor_data, temperature=33.33), timestamp))
 
     packet = lib_mqtt.encode_telemetry_records(records)
     data = json.loads(packet)
     assert len(data["d"]) == 2
     assert data["d"][0]["d"]["temperature"] == 44.44
+
+
+# The same output is expected from the json module and from orjson, when it is installed
+@pytest.mark.parametrize("encoder", [
+    lib_util._json_dumps_stdlib,
+    pytest.param(
+        getattr(lib_util, '_json_dumps_orjson', None),
+        marks=pytest.mark.skipif(lib_util.orjson is None, reason="orjson is not installed")
+    )
+], ids=["json", "orjson"])
+def test_json_encoders(encoder, sensor_data):
+    assert encoder({'a': 1, 'b': [1.5, None, True], 'c': "ü"}) == '{"a":1,"b":[1.5,null,true],"c":"ü"}'
+    assert encoder({1: 2, 'x': {3: 'y'}}) == '{"1":2,"x":{"3":"y"}}'
+    assert json.loads(encoder(sensor_data)) == dataclasses.asdict(sensor_data)
+
+    @dataclass
+    class PrivateFields:
+        a: int
+        _p: int
+    assert encoder({'d': PrivateFields(a=1, _p=2)}) == '{"d":{"a":1,"_p":2}}'
+
+    LatLong = collections.namedtuple('LatLong', ['lat', 'long'])
+    assert encoder({'loc': LatLong(44.787197, 20.457273)}) == '{"loc":[44.787197,20.457273]}'
+    assert encoder({'big': 2 ** 70}) == '{"big":1180591620717411303424}'
+
+    with pytest.raises(TypeError):
+        encoder({'ts': datetime.datetime.now(datetime.timezone.utc)})